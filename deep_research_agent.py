@@ -8,12 +8,16 @@ information from the web.
 
 import os
 import asyncio
+import functools
 import logging
+import re
+from contextvars import ContextVar
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union
 
 # Import OpenAI Agents SDK
-from agents import Agent, Runner, function_tool
+from agents import Agent, ModelSettings, Runner, function_tool, set_default_openai_client
+import httpx
 import openai
 
 # Import FireCrawl
@@ -27,17 +31,342 @@ except ImportError:
     except ImportError:
         raise ImportError("No se pudo importar FireCrawl. Asegúrate de tenerlo instalado con 'pip install firecrawl' o de tener el archivo firecrawl.py en el directorio")
 
+from semantic_cache import SemanticCache, TTLCache, cosine_similarity
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Default OpenAI model used by the research agents
+DEFAULT_MODEL = "gpt-4o"
+
+# Connection pool limits of the shared OpenAI client
+OPENAI_MAX_CONNECTIONS = 100
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = 32
+OPENAI_KEEPALIVE_EXPIRY_SECONDS = 60
+
+# Maximum number of FireCrawl requests in flight at once (avoids rate limiting)
+MAX_CONCURRENT_REQUESTS = 8
+# Maximum number of embeddings requests made at once when condensing tool output
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 4
+
+# Cache configuration for searches, extractions and research results
+EMBEDDING_MODEL = "text-embedding-3-small"
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 3600
+SEMANTIC_CACHE_THRESHOLD = 0.92
+
+# Maximum characters of content returned to the agents by each tool
+SEARCH_RESULT_MAX_CHARS = 2000
+EXTRACT_MAX_CHARS = 3000
+COMBINED_MAX_CHARS = 4000
+DEEP_RESEARCH_MAX_CHARS = 12000
+
+# Over-budget content is reduced to the sentences most similar to the query
+EXTRACTIVE_MAX_SENTENCES = 256
+EXTRACTIVE_MAX_SENTENCE_CHARS = 2000
+# Maximum number of inputs sent in one embeddings request
+EMBEDDING_BATCH_SIZE = 512
+
+# Speculative search run while the planner works; its results are kept only if
+# the research plan stays close to the original question
+SPECULATIVE_NUM_RESULTS = 3
+SPECULATION_MIN_SIMILARITY = 0.7
+
+# Characters not allowed in result filenames (anything but letters, digits, space, '-' and '_')
+_SANITIZE_RE = re.compile(r"[^\w \-]")
+
+# Sentence boundaries (kept as separators) used for extractive summaries
+_SENTENCE_SPLIT_RE = re.compile(r"((?<=[.!?])\s+|\n+)")
+# Marks the gap between sentences that were not adjacent in the source text
+_ELISION = " … "
+
+def _truncate(content: str, max_chars: int) -> str:
+    """Limit content length to avoid token issues"""
+    if len(content) > max_chars:
+        return content[:max_chars] + "...[content truncated]"
+    return content
+
+def _join_limited(parts: Iterable[str], max_chars: int) -> str:
+    """Join parts lazily, stopping as soon as max_chars have been collected"""
+    collected: List[str] = []
+    size = 0
+    for part in parts:
+        if size + len(part) > max_chars:
+            collected.append(_truncate(part, max_chars - size))
+            break
+        collected.append(part)
+        size += len(part)
+    return "".join(collected)
+
+def _split_sentences(content: str) -> List[Tuple[str, str]]:
+    """Split content into (sentence, trailing separator) pairs, dropping blank sentences"""
+    pieces = _SENTENCE_SPLIT_RE.split(content)
+    return [
+        (pieces[i], pieces[i + 1] if i + 1 < len(pieces) else "")
+        for i in range(0, len(pieces), 2)
+        if pieces[i].strip()
+    ]
+
+def _select_sentences(sentences: List[Tuple[str, str]], embeddings: List[List[float]],
+                      query_embedding: List[float], max_chars: int) -> str:
+    """Keep the sentences most similar to the query that fit in max_chars, in their original order, marking gaps"""
+    ranked = sorted(
+        range(len(sentences)),
+        key=lambda i: cosine_similarity(query_embedding, embeddings[i]),
+        reverse=True
+    )
+    
+    selected = []
+    size = 0
+    for i in ranked:
+        # Leave room for an elision marker in front of every sentence
+        length = sum(len(part) for part in sentences[i]) + len(_ELISION)
+        if size + length > max_chars:
+            continue
+        selected.append(i)
+        size += length
+    
+    pieces: List[str] = []
+    previous = None
+    for i in sorted(selected):
+        if previous is not None and i != previous + 1:
+            pieces[-1] = pieces[-1].rstrip()
+            pieces.append(_ELISION)
+        pieces.append("".join(sentences[i]))
+        previous = i
+    return "".join(pieces).strip()
+
+def _format_deep_research(research_results: Dict[str, Any]) -> Iterator[str]:
+    """
+    Format the result of FirecrawlApp.deep_research piece by piece.
+    
+    The sources (a list of page titles) come before the content, so they are kept
+    when the content is cut to the size budget.
+    
+    >>> "".join(_format_deep_research({"success": True, "content": "Text", "sources": ["Page"]}))
+    '# Deep Research Results\\n\\n## Sources\\n\\n1. Page\\n\\n## Content\\n\\nText\\n'
+    """
+    yield "# Deep Research Results\n\n"
+    
+    sources = research_results.get("sources", [])
+    if sources:
+        yield "## Sources\n\n"
+        for i, source in enumerate(sources, 1):
+            yield f"{i}. {source}\n"
+        yield "\n"
+    
+    content = research_results.get("content", "")
+    if content:
+        yield f"## Content\n\n{content}\n"
+
+@functools.lru_cache(maxsize=None)
+def _shared_openai_client(api_key: str) -> openai.AsyncOpenAI:
+    """Get the process-wide OpenAI client for an API key, so connections are reused by every agent"""
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        http_client=openai.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY_SECONDS
+            )
+        )
+    )
+
+# The DeepResearchAgent and question of the research() call running in the current context
+_current_agent: ContextVar["DeepResearchAgent"] = ContextVar("current_research_agent")
+_current_question: ContextVar[Optional[str]] = ContextVar("current_research_question", default=None)
+
+# URLs already extracted during the current research() call
+_seen_urls: ContextVar[Optional[Set[str]]] = ContextVar("seen_research_urls", default=None)
+
+def _claim_url(url: str) -> bool:
+    """Mark a URL as extracted in the current research, returning False if it already was"""
+    seen = _seen_urls.get()
+    if seen is None:
+        return True
+    if url in seen:
+        return False
+    seen.add(url)
+    return True
+
+def _release_url(url: str) -> None:
+    """Forget a claimed URL (e.g. after a failed extraction) so later queries can retry it"""
+    seen = _seen_urls.get()
+    if seen is not None:
+        seen.discard(url)
+
+def _discard_task(task: "asyncio.Task") -> None:
+    """Cancel a task whose result is no longer needed, retrieving any exception it already raised"""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+def _active_agent() -> "DeepResearchAgent":
+    """Get the DeepResearchAgent the shared agent tools should use"""
+    try:
+        return _current_agent.get()
+    except LookupError:
+        raise RuntimeError("Research tools can only be used inside DeepResearchAgent.research()")
+
+@functools.lru_cache(maxsize=None)
+def _build_agents(model: str) -> Dict[str, Agent]:
+    """
+    Create the agents used in the deep research system.
+    
+    The agents are built once per model and shared by every DeepResearchAgent; their
+    tools dispatch to the instance whose research() call is running.
+    
+    Args:
+        model: The OpenAI model used by the agents
+    
+    Returns:
+        Dictionary of agents
+    """
+    # Define tool functions that look up the active DeepResearchAgent at call time
+    @function_tool()
+    async def generate_search_queries(topic: str, num_queries: Optional[int] = None) -> List[str]:
+        """
+        Generate search queries for a given topic.
+        
+        Args:
+            topic: The main topic or question to research
+            num_queries: Number of search queries to generate (default: 3)
+        """
+        actual_num_queries = 3 if num_queries is None else num_queries
+        return await _active_agent()._generate_search_queries(topic, actual_num_queries)
+    
+    @function_tool()
+    async def search_web(query: str, num_results: Optional[int] = None) -> str:
+        """
+        Search the web for information on a topic.
+        
+        Args:
+            query: The search query
+            num_results: Number of results to return (default: 5)
+        """
+        actual_num_results = 5 if num_results is None else num_results
+        return await _active_agent()._search_web(query, actual_num_results)
+    
+    @function_tool()
+    async def batch_search_web(queries: List[str], num_results: Optional[int] = None) -> str:
+        """
+        Search the web for several independent queries at once.
+        
+        Args:
+            queries: The search queries
+            num_results: Number of results to return per query (default: 5)
+        """
+        actual_num_results = 5 if num_results is None else num_results
+        return await _active_agent()._batch_search_web(queries, actual_num_results)
+    
+    @function_tool()
+    async def deep_research_topic(query: str, max_depth: Optional[int] = None, time_limit: Optional[int] = None) -> str:
+        """
+        Perform deep research on a topic by searching and following links.
+        
+        Args:
+            query: The research query
+            max_depth: Maximum depth of link following (default: 5)
+            time_limit: Time limit in seconds (default: 180)
+        """
+        actual_max_depth = 5 if max_depth is None else max_depth
+        actual_time_limit = 180 if time_limit is None else time_limit
+        return await _active_agent()._deep_research_topic(query, actual_max_depth, actual_time_limit)
+    
+    @function_tool()
+    async def extract_from_url(url: str) -> str:
+        """
+        Extract content from a specific URL.
+        
+        Args:
+            url: The URL to extract content from
+        """
+        return await _active_agent()._extract_from_url(url)
+    
+    @function_tool()
+    async def search_and_extract(query: str, num_results: Optional[int] = None) -> str:
+        """
+        Search for content and extract from the top results.
+        
+        Args:
+            query: The search query
+            num_results: Number of results to extract from (default: 3)
+        """
+        actual_num_results = 3 if num_results is None else num_results
+        return await _active_agent()._search_and_extract(query, actual_num_results)
+        
+    # Create research planner agent
+    research_planner = Agent(
+        name="ResearchPlanner",
+        instructions="""You are a research planning expert. Your job is to:
+        1. Analyze the user's question to understand what they want to know
+        2. Break down complex questions into specific research queries
+        3. Determine the best search queries to find relevant information
+        4. Create a research plan with multiple angles to explore
+        
+        Be thorough and consider different perspectives on the topic.
+        """,
+        tools=[generate_search_queries],
+        model=model,
+    )
+    
+    # Create web researcher agent
+    web_researcher = Agent(
+        name="WebResearcher",
+        instructions="""You are a web research expert. Your job is to:
+        1. Execute search queries to find relevant information on the web
+        2. Extract key information from search results
+        3. Follow up with deeper research on specific subtopics when needed
+        4. Compile comprehensive information from multiple sources
+        
+        When you have two or more independent search queries, use batch_search_web
+        to run them all in a single call. Otherwise, issue independent tool calls in
+        the same turn so they run in parallel.
+        
+        Always cite your sources and be thorough in your research.
+        """,
+        tools=[
+            search_web, 
+            batch_search_web,
+            deep_research_topic, 
+            extract_from_url,
+            search_and_extract
+        ],
+        model=model,
+        model_settings=ModelSettings(parallel_tool_calls=True),
+    )
+    
+    # Create synthesis agent
+    synthesis_agent = Agent(
+        name="SynthesisAgent",
+        instructions="""You are an information synthesis expert. Your job is to:
+        1. Analyze research findings from multiple sources
+        2. Identify key insights and patterns
+        3. Reconcile conflicting information when present
+        4. Create a comprehensive, well-structured response to the original question
+        
+        Your response should be thorough, accurate, and easy to understand. Include citations
+        to sources where appropriate. Organize information logically and highlight the most
+        important points.
+        """,
+        tools=[],  # Synthesis agent doesn't need tools, just processes information
+        model=model,
+    )
+    
+    return {
+        "planner": research_planner,
+        "researcher": web_researcher,
+        "synthesis": synthesis_agent
+    }
+
 class DeepResearchAgent:
     """
     A research agent that combines OpenAI Agents with FireCrawl to perform deep research
     on any topic.
     """
     
-    def __init__(self, openai_api_key: Optional[str] = None, use_local_docker: bool = True, firecrawl_api_key: Optional[str] = None):
+    def __init__(self, openai_api_key: Optional[str] = None, use_local_docker: bool = True, firecrawl_api_key: Optional[str] = None, model: str = DEFAULT_MODEL):
         """
         Initialize the DeepResearchAgent.
         
@@ -45,6 +374,7 @@ class DeepResearchAgent:
             openai_api_key: OpenAI API key (if None, will try to get from environment)
             use_local_docker: Whether to use a local Docker instance for FireCrawl
             firecrawl_api_key: FireCrawl API key for cloud API (if None, will try to get from environment)
+            model: OpenAI model used by the research agents
         """
         # Set OpenAI API key
         self.openai_api_key = openai_api_key or os.getenv("OPENAI_API_KEY")
@@ -64,12 +394,72 @@ class DeepResearchAgent:
             self._initialize_local_docker()
         else:
             self._initialize_cloud_api()
+        
+        # Bound concurrent FireCrawl requests issued by parallel tool calls
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._embedding_semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_REQUESTS)
+        
+        # Share one pooled OpenAI client between the agents and the embeddings calls
+        self.openai_client = _shared_openai_client(self.openai_api_key)
+        set_default_openai_client(self.openai_client)
+        
+        # Cache searches, extractions and research results to skip repeated network I/O
+        self._search_cache = SemanticCache(
+            self._embed,
+            threshold=SEMANTIC_CACHE_THRESHOLD,
+            maxsize=CACHE_MAX_ENTRIES,
+            ttl=CACHE_TTL_SECONDS
+        )
+        self._research_cache = SemanticCache(
+            self._embed,
+            threshold=SEMANTIC_CACHE_THRESHOLD,
+            maxsize=CACHE_MAX_ENTRIES,
+            ttl=CACHE_TTL_SECONDS
+        )
+        self._url_cache = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS)
             
-        # Initialize agents
-        self.agents = self._create_agents()
+        # Initialize agents (built once per model and shared between instances)
+        self.model = model
+        self.agents = _build_agents(model)
         
         logger.info("DeepResearchAgent initialized successfully")
     
+    async def aclose(self):
+        """Close the pooled FireCrawl HTTP connections"""
+        await self._run_sync(self.firecrawl.close)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def warm_up(self):
+        """
+        Open a connection to the OpenAI API ahead of the next research call.
+        
+        Meant to run in the background while the caller is idle (e.g. waiting for
+        user input); failures are ignored.
+        """
+        try:
+            await self._embed(["warm up"])
+        except Exception as e:
+            logger.debug("Warm-up request failed: %s", e)
+    
+    async def _run_sync(self, fn, *args, **kwargs):
+        """
+        Run a blocking FireCrawl call in a worker thread so it doesn't block the event loop.
+        
+        Args:
+            fn: The synchronous function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            The function's return value
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    
     def _initialize_local_docker(self):
         """Initialize FireCrawl using local Docker"""
         logger.info("Initializing FireCrawl with local Docker")
@@ -78,7 +468,7 @@ class DeepResearchAgent:
             self.firecrawl = FirecrawlApp(api_url="http://localhost:3002")
             logger.info("FireCrawl initialized with local Docker")
         except Exception as e:
-            logger.error(f"Error initializing FireCrawl with local Docker: {str(e)}")
+            logger.error("Error initializing FireCrawl with local Docker: %s", e)
             raise ValueError(f"Failed to initialize FireCrawl with local Docker: {str(e)}")
     
     def _initialize_cloud_api(self):
@@ -91,134 +481,21 @@ class DeepResearchAgent:
             self.firecrawl = FirecrawlApp(api_key=self.firecrawl_api_key)
             logger.info("FireCrawl initialized with cloud API")
         except Exception as e:
-            logger.error(f"Error initializing FireCrawl with cloud API: {str(e)}")
+            logger.error("Error initializing FireCrawl with cloud API: %s", e)
             raise ValueError(f"Failed to initialize FireCrawl with cloud API: {str(e)}")
 
-    def _create_agents(self):
+    async def _embed(self, texts: List[str]) -> List[List[float]]:
         """
-        Create the agents used in the deep research system.
+        Embed texts with the OpenAI embeddings API.
         
+        Args:
+            texts: The texts to embed
+            
         Returns:
-            Dictionary of agents
-        """
-        # Define tool functions that don't include 'self' parameter
-        @function_tool()
-        async def generate_search_queries(topic: str, num_queries: Optional[int] = None) -> List[str]:
-            """
-            Generate search queries for a given topic.
-            
-            Args:
-                topic: The main topic or question to research
-                num_queries: Number of search queries to generate (default: 3)
-            """
-            actual_num_queries = 3 if num_queries is None else num_queries
-            return await self._generate_search_queries(topic, actual_num_queries)
-        
-        @function_tool()
-        async def search_web(query: str, num_results: Optional[int] = None) -> str:
-            """
-            Search the web for information on a topic.
-            
-            Args:
-                query: The search query
-                num_results: Number of results to return (default: 5)
-            """
-            actual_num_results = 5 if num_results is None else num_results
-            return await self._search_web(query, actual_num_results)
-        
-        @function_tool()
-        async def deep_research_topic(query: str, max_depth: Optional[int] = None, time_limit: Optional[int] = None) -> str:
-            """
-            Perform deep research on a topic by searching and following links.
-            
-            Args:
-                query: The research query
-                max_depth: Maximum depth of link following (default: 5)
-                time_limit: Time limit in seconds (default: 180)
-            """
-            actual_max_depth = 5 if max_depth is None else max_depth
-            actual_time_limit = 180 if time_limit is None else time_limit
-            return await self._deep_research_topic(query, actual_max_depth, actual_time_limit)
-        
-        @function_tool()
-        async def extract_from_url(url: str) -> str:
-            """
-            Extract content from a specific URL.
-            
-            Args:
-                url: The URL to extract content from
-            """
-            return await self._extract_from_url(url)
-        
-        @function_tool()
-        async def search_and_extract(query: str, num_results: Optional[int] = None) -> str:
-            """
-            Search for content and extract from the top results.
-            
-            Args:
-                query: The search query
-                num_results: Number of results to extract from (default: 3)
-            """
-            actual_num_results = 3 if num_results is None else num_results
-            return await self._search_and_extract(query, actual_num_results)
-            
-        # Create research planner agent
-        research_planner = Agent(
-            name="ResearchPlanner",
-            instructions="""You are a research planning expert. Your job is to:
-            1. Analyze the user's question to understand what they want to know
-            2. Break down complex questions into specific research queries
-            3. Determine the best search queries to find relevant information
-            4. Create a research plan with multiple angles to explore
-            
-            Be thorough and consider different perspectives on the topic.
-            """,
-            tools=[generate_search_queries],
-            model="gpt-4o",
-        )
-        
-        # Create web researcher agent
-        web_researcher = Agent(
-            name="WebResearcher",
-            instructions="""You are a web research expert. Your job is to:
-            1. Execute search queries to find relevant information on the web
-            2. Extract key information from search results
-            3. Follow up with deeper research on specific subtopics when needed
-            4. Compile comprehensive information from multiple sources
-            
-            Always cite your sources and be thorough in your research.
-            """,
-            tools=[
-                search_web, 
-                deep_research_topic, 
-                extract_from_url,
-                search_and_extract
-            ],
-            model="gpt-4o",
-        )
-        
-        # Create synthesis agent
-        synthesis_agent = Agent(
-            name="SynthesisAgent",
-            instructions="""You are an information synthesis expert. Your job is to:
-            1. Analyze research findings from multiple sources
-            2. Identify key insights and patterns
-            3. Reconcile conflicting information when present
-            4. Create a comprehensive, well-structured response to the original question
-            
-            Your response should be thorough, accurate, and easy to understand. Include citations
-            to sources where appropriate. Organize information logically and highlight the most
-            important points.
-            """,
-            tools=[],  # Synthesis agent doesn't need tools, just processes information
-            model="gpt-4o",
-        )
-        
-        return {
-            "planner": research_planner,
-            "researcher": web_researcher,
-            "synthesis": synthesis_agent
-        }
+            One embedding vector per text
+        """
+        response = await self.openai_client.embeddings.create(model=EMBEDDING_MODEL, input=texts)
+        return [item.embedding for item in response.data]
     
     # FireCrawl Tool Functions (internal implementation)
     async def _generate_search_queries(self, topic: str, num_queries: int = 3) -> List[str]:
@@ -236,6 +513,79 @@ class DeepResearchAgent:
         # We'll just return the input as the first query, and let the agent generate the rest
         return [topic]
     
+    async def _search_and_extract_results(self, query: str, num_results: int) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Search the web and extract content from all the results concurrently.
+        
+        Results whose URL was already extracted during the current research() call
+        are skipped. URLs are claimed before extraction so concurrent queries don't
+        extract the same page twice, and released again if their extraction fails.
+        
+        Args:
+            query: The search query
+            num_results: Number of results to extract from
+            
+        Returns:
+            List of extracted results, each with a 'search_metadata' entry, and the
+            list of skipped URLs
+        """
+        async with self._request_semaphore:
+            search_results = await self._run_sync(self.firecrawl.search, query, {"limit": num_results})
+        
+        items = [
+            item for item in search_results.get("data", [])[:num_results]
+            if item.get("url") or item.get("link")
+        ]
+        
+        # Skip pages already extracted by another query of this research
+        skipped: List[str] = []
+        unseen = []
+        for item in items:
+            url = item.get("url") or item.get("link")
+            if _claim_url(url):
+                unseen.append(item)
+            else:
+                skipped.append(url)
+        items = unseen
+        
+        extracted = await asyncio.gather(
+            *[self._extract_search_result(item, position) for position, item in enumerate(items, 1)],
+            return_exceptions=True
+        )
+        
+        results = []
+        for item, result in zip(items, extracted):
+            if isinstance(result, Exception):
+                url = item.get("url") or item.get("link")
+                logger.error("Error extracting content from search result %s: %s", url, result)
+                _release_url(url)
+                continue
+            results.append(result)
+        return results, skipped
+    
+    async def _extract_search_result(self, item: Dict[str, Any], position: int) -> Dict[str, Any]:
+        """
+        Extract content from a single search result.
+        
+        Args:
+            item: The search result returned by FireCrawl
+            position: Position of the result in the search ranking
+            
+        Returns:
+            Extracted content with the search result metadata attached
+        """
+        url = item.get("url") or item.get("link")
+        async with self._request_semaphore:
+            content = await self._run_sync(self.firecrawl.extract_from_url, url, ["markdown"])
+        
+        content["search_metadata"] = {
+            "title": item.get("title", ""),
+            "snippet": item.get("snippet") or item.get("description", ""),
+            "position": item.get("position", position),
+            "url": url
+        }
+        return content
+    
     async def _search_web(self, query: str, num_results: int = 5) -> str:
         """
         Search the web for information on a topic.
@@ -247,40 +597,107 @@ class DeepResearchAgent:
         Returns:
             Search results as formatted text
         """
-        try:
-            logger.info(f"Searching web for: {query}")
-            results = self.firecrawl.search_and_extract(
-                query=query,
-                limit=num_results,
-                formats=["markdown"]
-            )
+        return (await self._search_web_many([query], num_results))[0]
+    
+    async def _batch_search_web(self, queries: List[str], num_results: int = 5) -> str:
+        """
+        Search the web for several queries concurrently.
+        
+        Args:
+            queries: The search queries
+            num_results: Number of results to return per query
+            
+        Returns:
+            Search results for every query as formatted text
+        """
+        logger.info("Batch searching web for %d queries", len(queries))
+        results = await self._search_web_many(queries, num_results)
+        return "".join(f"# Results for: {query}\n\n{result}\n\n" for query, result in zip(queries, results))
+    
+    async def _search_web_many(self, queries: List[str], num_results: int) -> List[str]:
+        """
+        Search the web for several queries concurrently and format the results of each.
+        
+        The content of every result, across all queries, is condensed together so a
+        tool call makes a single batched embeddings request.
+        
+        Args:
+            queries: The search queries
+            num_results: Number of results to return per query
             
-            # Format the results
-            formatted_results = ""
+        Returns:
+            Search results as formatted text (or an error message) for each query
+        """
+        searches = await asyncio.gather(
+            *[self._fetch_search_results(query, num_results) for query in queries],
+            return_exceptions=True
+        )
+        
+        # Keep the most relevant part of every result
+        contents = iter(await self._condense_many([
+            (result["markdown"], query)
+            for query, search in zip(queries, searches) if isinstance(search, tuple)
+            for result in search[0] if "markdown" in result
+        ], SEARCH_RESULT_MAX_CHARS))
+        
+        formatted: List[str] = []
+        for query, search in zip(queries, searches):
+            if isinstance(search, Exception):
+                logger.error("Error in search_web for %s: %s", query, search)
+                formatted.append(f"Error searching the web: {str(search)}")
+                continue
+            if isinstance(search, str):
+                formatted.append(search)
+                continue
+            
+            # Format the results as one (url, text) section per result
+            results, skipped = search
+            sections: List[Tuple[str, str]] = []
             for i, result in enumerate(results, 1):
                 url = result.get("search_metadata", {}).get("url", "Unknown URL")
                 title = result.get("search_metadata", {}).get("title", f"Result {i}")
                 
-                formatted_results += f"## {title}\n"
-                formatted_results += f"Source: {url}\n\n"
-                
                 if "markdown" in result:
-                    # Limit content length to avoid token issues
-                    content = result["markdown"]
-                    if len(content) > 2000:
-                        content = content[:2000] + "...[content truncated]"
-                    formatted_results += content + "\n\n"
+                    body = next(contents)
                 else:
-                    formatted_results += "No content extracted\n\n"
+                    body = "No content extracted"
+                sections.append((url, f"## {title}\nSource: {url}\n\n{body}\n\n"))
             
-            if not results:
-                return "No search results found."
-                
-            return formatted_results
+            # Results with duplicates removed are specific to this research, so don't cache them
+            if not skipped:
+                await self._search_cache.set(query, sections, scope=num_results)
+            formatted.append("".join(section for _, section in sections))
+        return formatted
+    
+    async def _fetch_search_results(self, query: str, num_results: int) -> Union[str, Tuple[List[Dict[str, Any]], List[str]]]:
+        """
+        Get the results of a search from the cache or the web.
+        
+        Args:
+            query: The search query
+            num_results: Number of results to return
             
-        except Exception as e:
-            logger.error(f"Error in search_web: {str(e)}")
-            return f"Error searching the web: {str(e)}"
+        Returns:
+            The final text when it needs no condensing (cached results or nothing
+            found), otherwise the extracted results and the list of skipped URLs
+        """
+        cached = await self._search_cache.get(query, scope=num_results)
+        if cached is not None:
+            logger.info("Using cached search results for: %s", query)
+            # Cached sections are per URL, so pages already seen in this research can still be dropped
+            sections = [section for url, section in cached if _claim_url(url)]
+            if not sections:
+                return "All search results were already retrieved earlier in this research."
+            return "".join(sections)
+        
+        logger.info("Searching web for: %s", query)
+        results, skipped = await self._search_and_extract_results(query, num_results)
+        
+        if not results:
+            if skipped:
+                return "All search results were already retrieved earlier in this research."
+            return "No search results found."
+        return results, skipped
     
     async def _deep_research_topic(self, query: str, max_depth: int = 5, time_limit: int = 180) -> str:
         """
@@ -295,40 +712,24 @@ class DeepResearchAgent:
             Research results as formatted text
         """
         try:
-            logger.info(f"Starting deep research on: {query}")
-            research_results = self.firecrawl.deep_research(
-                query=query,
-                max_depth=max_depth,
-                max_urls=10,
-                time_limit=time_limit
-            )
+            logger.info("Starting deep research on: %s", query)
+            async with self._request_semaphore:
+                research_results = await self._run_sync(
+                    self.firecrawl.deep_research,
+                    query=query,
+                    max_depth=max_depth,
+                    max_urls=10,
+                    time_limit=time_limit
+                )
             
             if not research_results.get("success", False):
                 return f"Deep research failed: {research_results.get('error', 'Unknown error')}"
             
-            # Format the results
-            formatted_results = "# Deep Research Results\n\n"
-            
-            # Add summaries
-            summaries = research_results.get("summaries", [])
-            if summaries:
-                formatted_results += "## Summaries\n\n"
-                for i, summary in enumerate(summaries, 1):
-                    formatted_results += f"### Summary {i}\n{summary}\n\n"
-            
-            # Add sources
-            sources = research_results.get("sources", [])
-            if sources:
-                formatted_results += "## Sources\n\n"
-                for i, source in enumerate(sources, 1):
-                    url = source.get("url", "Unknown URL")
-                    title = source.get("title", f"Source {i}")
-                    formatted_results += f"{i}. [{title}]({url})\n"
-            
-            return formatted_results
+            # Only the part of the results the agents can use is ever formatted
+            return _join_limited(_format_deep_research(research_results), DEEP_RESEARCH_MAX_CHARS)
             
         except Exception as e:
-            logger.error(f"Error in deep_research_topic: {str(e)}")
+            logger.error("Error in deep_research_topic: %s", e)
             return f"Error performing deep research: {str(e)}"
     
     async def _extract_from_url(self, url: str) -> str:
@@ -342,37 +743,146 @@ class DeepResearchAgent:
             Extracted content as formatted text
         """
         try:
-            logger.info(f"Extracting content from URL: {url}")
-            result = self.firecrawl.extract_from_url(
-                url=url,
-                formats=["markdown"],
-                extract_metadata=True
-            )
+            result = self._url_cache.get(url)
+            if result is not None:
+                logger.info("Using cached content for URL: %s", url)
+            else:
+                logger.info("Extracting content from URL: %s", url)
+                async with self._request_semaphore:
+                    result = await self._run_sync(
+                        self.firecrawl.extract_from_url,
+                        url=url,
+                        formats=["markdown"],
+                        extract_metadata=True
+                    )
+                self._url_cache.set(url, result)
             
             # Format the result
-            formatted_result = f"# Content from {url}\n\n"
+            parts: List[str] = [f"# Content from {url}\n\n"]
             
             metadata = result.get("metadata", {})
             if metadata:
                 title = metadata.get("title", "")
                 if title:
-                    formatted_result += f"## {title}\n\n"
+                    parts.append(f"## {title}\n\n")
             
             if "markdown" in result:
-                # Limit content length to avoid token issues
-                content = result["markdown"]
-                if len(content) > 3000:
-                    content = content[:3000] + "...[content truncated]"
-                formatted_result += content
+                # Rank the page content against the research question when there is one
+                query = _current_question.get() or metadata.get("title") or url
+                parts.append(await self._condense(result["markdown"], query, EXTRACT_MAX_CHARS))
             else:
-                formatted_result += "No content extracted"
+                parts.append("No content extracted")
             
-            return formatted_result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error in extract_from_url: {str(e)}")
+            logger.error("Error in extract_from_url: %s", e)
             return f"Error extracting content from URL: {str(e)}"
     
+    async def _combine_results(self, results: List[Dict[str, Any]], query: str) -> str:
+        """
+        Combine extracted search results into a single text for the agents.
+        
+        Args:
+            results: Extracted search results
+            query: The query the results were retrieved for
+            
+        Returns:
+            Combined content as formatted text
+        """
+        # Use the combine_results_for_llm method to format the results
+        combined_content = self.firecrawl.combine_results_for_llm(
+            results=results,
+            format="markdown",
+            include_metadata=True
+        )
+        return await self._condense(combined_content, query, COMBINED_MAX_CHARS)
+    
+    async def _condense(self, content: str, query: str, max_chars: int) -> str:
+        """
+        Reduce content to the sentences most relevant to a query.
+        
+        Args:
+            content: The content to reduce
+            query: The query used to rank sentences
+            max_chars: Maximum number of characters to keep
+            
+        Returns:
+            The content if it fits the budget, otherwise an extractive summary
+        """
+        return (await self._condense_many([(content, query)], max_chars))[0]
+    
+    async def _condense_many(self, items: List[Tuple[str, str]], max_chars: int) -> List[str]:
+        """
+        Reduce several contents to the sentences most relevant to their queries.
+        
+        Sentences are ranked by embedding similarity to their query and the best ones
+        are kept, in their original order, until the character budget is used. The
+        sentences of all contents are embedded together, in as few requests as
+        possible. Only the first EXTRACTIVE_MAX_SENTENCES sentences of each content
+        are ranked; anything after them is never considered. Falls back to plain
+        truncation if the embeddings request fails.
+        
+        Args:
+            items: (content, query) pairs to reduce
+            max_chars: Maximum number of characters to keep from each content
+            
+        Returns:
+            For each pair, the content if it fits the budget, otherwise an extractive summary
+        """
+        condensed = [content for content, _ in items]
+        pending = [i for i, (content, _) in enumerate(items) if len(content) > max_chars]
+        if not pending:
+            return condensed
+        
+        sentences = {i: _split_sentences(items[i][0])[:EXTRACTIVE_MAX_SENTENCES] for i in pending}
+        queries = list(dict.fromkeys(items[i][1] for i in pending))
+        
+        try:
+            embeddings = await self._embed_batched(
+                queries + [
+                    sentence[:EXTRACTIVE_MAX_SENTENCE_CHARS]
+                    for i in pending for sentence, _ in sentences[i]
+                ]
+            )
+        except Exception as e:
+            logger.warning("Could not rank content by relevance, truncating instead: %s", e)
+            for i in pending:
+                condensed[i] = _truncate(items[i][0], max_chars)
+            return condensed
+        
+        query_embeddings = dict(zip(queries, embeddings))
+        offset = len(queries)
+        for i in pending:
+            content, query = items[i]
+            count = len(sentences[i])
+            summary = _select_sentences(
+                sentences[i], embeddings[offset:offset + count], query_embeddings[query], max_chars
+            )
+            condensed[i] = summary or _truncate(content, max_chars)
+            offset += count
+        return condensed
+    
+    async def _embed_batched(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in requests of at most EMBEDDING_BATCH_SIZE inputs, bounded by the embedding request limit.
+        
+        Args:
+            texts: The texts to embed
+            
+        Returns:
+            One embedding vector per text
+        """
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with self._embedding_semaphore:
+                return await self._embed(batch)
+        
+        batches = await asyncio.gather(*[
+            embed_batch(texts[i:i + EMBEDDING_BATCH_SIZE])
+            for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+        ])
+        return [embedding for batch in batches for embedding in batch]
+    
     async def _search_and_extract(self, query: str, num_results: int = 3) -> str:
         """
         Search for content and extract from the top results.
@@ -385,30 +895,55 @@ class DeepResearchAgent:
             Extracted content as formatted text
         """
         try:
-            logger.info(f"Searching and extracting for: {query}")
-            results = self.firecrawl.search_and_extract(
-                query=query,
-                limit=num_results,
-                formats=["markdown"]
-            )
-            
-            # Use the combine_results_for_llm method to format the results
-            combined_content = self.firecrawl.combine_results_for_llm(
-                results=results,
-                format="markdown",
-                include_metadata=True
-            )
-            
-            # Limit content length to avoid token issues
-            if len(combined_content) > 4000:
-                combined_content = combined_content[:4000] + "...[content truncated]"
-            
-            return combined_content
+            logger.info("Searching and extracting for: %s", query)
+            results, _ = await self._search_and_extract_results(query, num_results)
+            return await self._combine_results(results, query)
             
         except Exception as e:
-            logger.error(f"Error in search_and_extract: {str(e)}")
+            logger.error("Error in search_and_extract: %s", e)
             return f"Error searching and extracting: {str(e)}"
     
+    async def _speculative_results(self, speculative: "asyncio.Task", question: str, planning_output: str) -> Optional[str]:
+        """
+        Resolve the speculative search started before planning.
+        
+        The results are kept only if the research plan is similar enough to the
+        question; otherwise the search is cancelled if it is still running.
+        
+        Args:
+            speculative: Task running the speculative search
+            question: The user's question
+            planning_output: The research plan produced by the planner
+            
+        Returns:
+            Formatted speculative results, or None if they were discarded
+        """
+        try:
+            question_embedding, plan_embedding = await self._embed([question, planning_output[:8000]])
+            similarity = cosine_similarity(question_embedding, plan_embedding)
+        except Exception as e:
+            logger.warning("Could not compare research plan with question: %s", e)
+            similarity = 1.0
+        
+        if similarity < SPECULATION_MIN_SIMILARITY:
+            logger.info("Discarding speculative search (similarity %.2f)", similarity)
+            _discard_task(speculative)
+            return None
+        
+        try:
+            results, _ = await speculative
+        except Exception as e:
+            logger.warning("Speculative search failed: %s", e)
+            return None
+        
+        if not results:
+            return None
+        
+        # The researcher gets these pages in its input, so don't extract them again
+        for result in results:
+            _claim_url(result["search_metadata"]["url"])
+        return await self._combine_results(results, question)
+    
     async def research(self, question: str) -> str:
         """
         Perform deep research on a question using a multi-agent approach.
@@ -419,8 +954,24 @@ class DeepResearchAgent:
         Returns:
             Comprehensive research results
         """
+        cached = await self._research_cache.get(question)
+        if cached is not None:
+            logger.info("Using cached research results for: %s", question)
+            return cached
+        
+        # Search for the question itself while the planner works to hide its latency
+        # (started before URL tracking so discarded results don't mark pages as seen)
+        speculative = asyncio.create_task(
+            self._search_and_extract_results(question, SPECULATIVE_NUM_RESULTS)
+        )
+        
+        # Route the shared agent tools to this instance and track the URLs it extracts
+        token = _current_agent.set(self)
+        question_token = _current_question.set(question)
+        seen_token = _seen_urls.set(set())
+        
         try:
-            logger.info(f"Starting research on question: {question}")
+            logger.info("Starting research on question: %s", question)
             
             # Step 1: Planning research
             logger.info("Step 1: Planning research")
@@ -431,18 +982,23 @@ class DeepResearchAgent:
                 max_turns=20  # Aumentamos el número máximo de turnos
             )
             planning_output = planning_result.final_output
-            logger.info(f"Planning complete: {len(planning_output)} characters of output")
+            logger.info("Planning complete: %d characters of output", len(planning_output))
+            
+            research_input = f"Research question: {question}\n\nResearch plan:\n{planning_output}"
+            speculative_output = await self._speculative_results(speculative, question, planning_output)
+            if speculative_output:
+                research_input = f"Preliminary search results:\n{speculative_output}\n\n{research_input}"
             
             # Step 2: Gathering information
             logger.info("Step 2: Gathering information")
             runner = Runner()
             research_result = await runner.run(
                 starting_agent=self.agents["researcher"],
-                input=f"Research question: {question}\n\nResearch plan:\n{planning_output}",
+                input=research_input,
                 max_turns=20  # Aumentamos el número máximo de turnos
             )
             research_output = research_result.final_output
-            logger.info(f"Research complete: {len(research_output)} characters of output")
+            logger.info("Research complete: %d characters of output", len(research_output))
             
             # Step 3: Synthesizing findings
             logger.info("Step 3: Synthesizing findings")
@@ -453,7 +1009,7 @@ class DeepResearchAgent:
                 max_turns=20  # Aumentamos el número máximo de turnos
             )
             synthesis_output = synthesis_result.final_output
-            logger.info(f"Synthesis complete: {len(synthesis_output)} characters of output")
+            logger.info("Synthesis complete: %d characters of output", len(synthesis_output))
             
             # Combine all results
             final_result = f"""
@@ -465,10 +1021,11 @@ RESULTADOS DE LA INVESTIGACIÓN:
 
 ================================================================================
 """
+            await self._research_cache.set(question, final_result)
             return final_result
             
         except Exception as e:
-            logger.error(f"Error in research: {str(e)}")
+            logger.error("Error in research: %s", e)
             return f"""
 ================================================================================
 RESULTADOS DE LA INVESTIGACIÓN:
@@ -478,8 +1035,19 @@ Error performing research: {str(e)}
 
 ================================================================================
 """
+        finally:
+            # Stop the speculative search if it is still running, including when research() is cancelled
+            _discard_task(speculative)
+            _current_agent.reset(token)
+            _current_question.reset(question_token)
+            _seen_urls.reset(seen_token)
 
-def save_research_results(topic: str, results: str):
+def _write_text_file(filename: str, content: str):
+    """Write text to a file using UTF-8 encoding"""
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(content)
+
+async def save_research_results(topic: str, results: str):
     """
     Save research results to a Markdown file.
     
@@ -488,8 +1056,7 @@ def save_research_results(topic: str, results: str):
         results: The research results text
     """
     # Create a sanitized filename from the topic
-    sanitized_topic = "".join(c if c.isalnum() or c in " -_" else "_" for c in topic)
-    sanitized_topic = sanitized_topic[:50]  # Limit length
+    sanitized_topic = _SANITIZE_RE.sub("_", topic[:50])  # Limit length
     
     # Create a timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -505,11 +1072,10 @@ def save_research_results(topic: str, results: str):
 {results}
 """
     
-    # Save to file
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
+    # Save to file without blocking the event loop
+    await asyncio.to_thread(_write_text_file, filename, content)
     
-    logger.info(f"Research results saved to {filename}")
+    logger.info("Research results saved to %s", filename)
     return filename
 
 # Command-line interface
@@ -521,33 +1087,38 @@ async def main():
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
         print("Warning: OPENAI_API_KEY environment variable not set.")
-        openai_api_key = input("Please enter your OpenAI API key: ")
+        openai_api_key = await asyncio.to_thread(input, "Please enter your OpenAI API key: ")
     
     # Initialize the agent
     try:
-        agent = DeepResearchAgent(openai_api_key=openai_api_key, use_local_docker=True)
-        print("Deep Research Agent initialized successfully!")
-        
-        while True:
-            # Get user question
-            question = input("\nEnter your research question (or 'quit' to exit): ")
-            if question.lower() in ["quit", "exit", "q"]:
-                break
-            
-            print("\nResearching... (this may take a few minutes)")
-            
-            # Perform research
-            result = await agent.research(question)
+        async with DeepResearchAgent(openai_api_key=openai_api_key, use_local_docker=True) as agent:
+            print("Deep Research Agent initialized successfully!")
             
-            print("\n" + "="*80 + "\n")
-            print("RESEARCH RESULTS:")
-            print("\n" + "="*80 + "\n")
-            print(result)
-            print("\n" + "="*80 + "\n")
+            # Warm up connections once while the first question is typed; later
+            # questions reuse the connections kept alive by the previous research
+            warm_up = asyncio.create_task(agent.warm_up())
             
-            # Save results to file
-            filename = save_research_results(question, result)
-            print(f"\nResults saved to: {filename}")
+            while True:
+                # Get user question without blocking the event loop
+                question = await asyncio.to_thread(input, "\nEnter your research question (or 'quit' to exit): ")
+                if question.lower() in ["quit", "exit", "q"]:
+                    _discard_task(warm_up)
+                    break
+                
+                print("\nResearching... (this may take a few minutes)")
+                
+                # Perform research
+                result = await agent.research(question)
+                
+                print("\n" + "="*80 + "\n")
+                print("RESEARCH RESULTS:")
+                print("\n" + "="*80 + "\n")
+                print(result)
+                print("\n" + "="*80 + "\n")
+                
+                # Save results to file
+                filename = await save_research_results(question, result)
+                print(f"\nResults saved to: {filename}")
             
     except Exception as e:
         print(f"Error initializing or running the Deep Research Agent: {str(e)}")
@@ -50,7 +50,7 @@ async def main():
     
     # Guardar resultados en un archivo
     from deep_research_agent import save_research_results
-    filename = save_research_results(question, result)
+    filename = await save_research_results(question, result)
     print(f"\nResultados guardados en: {filename}")
 
 if __name__ == "__main__":
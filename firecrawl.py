@@ -16,11 +16,40 @@ from typing import Any, Dict, Optional, List, Union, Callable
 import json
 
 import requests
+from requests.adapters import HTTPAdapter
 import pydantic
 import websockets
 
+try:
+    # Optional: orjson decodes large responses several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 logger : logging.Logger = logging.getLogger("firecrawl")
 
+# Connection pool sizing for the shared HTTP session
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Backoff between status checks of crawl and batch scrape jobs (seconds)
+JOB_POLL_INITIAL_DELAY = 1
+JOB_POLL_MAX_DELAY = 10
+
+def _parse_json(response: requests.Response) -> Any:
+    """
+    Decode the JSON body of a response, using orjson when it is installed.
+
+    Args:
+        response (requests.Response): The response to decode.
+
+    Returns:
+        Any: The decoded JSON data.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 class SearchParams(pydantic.BaseModel):
     query: str
     limit: Optional[int] = 5
@@ -107,13 +136,15 @@ class FirecrawlApp:
         data: Optional[Any] = None
         error: Optional[str] = None
 
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
+    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None, session: Optional[requests.Session] = None) -> None:
         """
         Initialize the FirecrawlApp instance with API key, API URL.
 
         Args:
             api_key (Optional[str]): API key for authenticating with the Firecrawl API.
             api_url (Optional[str]): Base URL for the Firecrawl API.
+            session (Optional[requests.Session]): HTTP session to reuse for all requests.
+                If None, a pooled keep-alive session is created and owned by this instance.
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
@@ -122,9 +153,34 @@ class FirecrawlApp:
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
             logger.warning("No API key provided for cloud service")
             raise ValueError('No API key provided')
+        
+        # Reuse TCP/TLS connections across requests instead of reconnecting on every call
+        self._owns_session = session is None
+        self.session = session or self._create_session()
             
         logger.debug(f"Initialized FirecrawlApp with API URL: {self.api_url}")
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a keep-alive HTTP session with a connection pool large enough for concurrent callers.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session if it was created by this instance.
+        """
+        if self._owns_session:
+            self.session.close()
+
     def scrape_url(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """
         Scrape the specified URL using the Firecrawl API.
@@ -173,7 +229,7 @@ class FirecrawlApp:
 
         endpoint = f'/v1/scrape'
         # Make the POST request with the prepared headers and JSON data
-        response = requests.post(
+        response = self.session.post(
             f'{self.api_url}{endpoint}',
             headers=headers,
             json=scrape_params,
@@ -181,7 +237,7 @@ class FirecrawlApp:
         )
         if response.status_code == 200:
             try:
-                response = response.json()
+                response = _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if response['success'] and 'data' in response:
@@ -213,7 +269,7 @@ class FirecrawlApp:
             search_params = params
             search_params.query = query
 
-        response = requests.post(
+        response = self.session.post(
             f"{self.api_url}/v1/search",
             headers={"Authorization": f"Bearer {self.api_key}"},
             json=search_params.dict(exclude_none=True)
@@ -223,7 +279,7 @@ class FirecrawlApp:
             raise Exception(f"Request failed with status code {response.status_code}")
 
         try:
-            return response.json()
+            return _parse_json(response)
         except:
             raise Exception(f'Failed to parse Firecrawl response as JSON.')
 
@@ -237,7 +293,7 @@ class FirecrawlApp:
         Args:
             url (str): The URL to crawl.
             params (Optional[Dict[str, Any]]): Additional parameters for the crawl request.
-            poll_interval (Optional[int]): Time in seconds between status checks when waiting for job completion. Defaults to 2 seconds.
+            poll_interval (Optional[int]): Longest time in seconds between status checks when waiting for job completion, if above JOB_POLL_MAX_DELAY. Checks start 1 second apart and back off exponentially. Defaults to 2 seconds.
             idempotency_key (Optional[str]): A unique uuid key to ensure idempotency of requests.
 
         Returns:
@@ -261,7 +317,7 @@ class FirecrawlApp:
         response = self._post_request(f'{self.api_url}{endpoint}', json_data, headers)
         if response.status_code == 200:
             try:
-                id = response.json().get('id')
+                id = _parse_json(response).get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             return self._monitor_job_status(id, headers, poll_interval)
@@ -293,7 +349,7 @@ class FirecrawlApp:
         response = self._post_request(f'{self.api_url}{endpoint}', json_data, headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -318,7 +374,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}{endpoint}', headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
@@ -337,7 +393,7 @@ class FirecrawlApp:
                                 logger.error(f"Failed to fetch next page: {status_response.status_code}")
                                 break
                             try:
-                                next_data = status_response.json()
+                                next_data = _parse_json(status_response)
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             data.extend(next_data.get('data', []))
@@ -383,7 +439,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/crawl/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -403,7 +459,7 @@ class FirecrawlApp:
         response = self._delete_request(f'{self.api_url}/v1/crawl/{id}', headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -447,14 +503,14 @@ class FirecrawlApp:
             json_data.update(params)
 
         # Make the POST request with the prepared headers and JSON data
-        response = requests.post(
+        response = self.session.post(
             f'{self.api_url}{endpoint}',
             headers=headers,
             json=json_data,
         )
         if response.status_code == 200:
             try:
-                response = response.json()
+                response = _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if response['success'] and 'links' in response:
@@ -476,7 +532,7 @@ class FirecrawlApp:
         Args:
             urls (List[str]): The URLs to scrape.
             params (Optional[Dict[str, Any]]): Additional parameters for the scraper.
-            poll_interval (Optional[int]): Time in seconds between status checks when waiting for job completion. Defaults to 2 seconds.
+            poll_interval (Optional[int]): Longest time in seconds between status checks when waiting for job completion, if above JOB_POLL_MAX_DELAY. Checks start 1 second apart and back off exponentially. Defaults to 2 seconds.
             idempotency_key (Optional[str]): A unique uuid key to ensure idempotency of requests.
 
         Returns:
@@ -500,7 +556,7 @@ class FirecrawlApp:
         response = self._post_request(f'{self.api_url}{endpoint}', json_data, headers)
         if response.status_code == 200:
             try:
-                id = response.json().get('id')
+                id = _parse_json(response).get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             return self._monitor_job_status(id, headers, poll_interval)
@@ -532,7 +588,7 @@ class FirecrawlApp:
         response = self._post_request(f'{self.api_url}{endpoint}', json_data, headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -575,7 +631,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}{endpoint}', headers)
         if response.status_code == 200:
             try:
-                status_data = response.json()
+                status_data = _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
@@ -594,7 +650,7 @@ class FirecrawlApp:
                                 logger.error(f"Failed to fetch next page: {status_response.status_code}")
                                 break
                             try:
-                                next_data = status_response.json()
+                                next_data = _parse_json(status_response)
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             data.extend(next_data.get('data', []))
@@ -640,7 +696,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/batch/scrape/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return response.json()
+                return _parse_json(response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -695,7 +751,7 @@ class FirecrawlApp:
             )
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = _parse_json(response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if data['success']:
@@ -711,7 +767,7 @@ class FirecrawlApp:
                         )
                         if status_response.status_code == 200:
                             try:
-                                status_data = status_response.json()
+                                status_data = _parse_json(status_response)
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             if status_data['status'] == 'completed':
@@ -752,7 +808,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/extract/{job_id}', headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _parse_json(response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -796,7 +852,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/extract', request_data, headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _parse_json(response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -883,7 +939,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/llmstxt', json_data, headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _parse_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             else:
@@ -911,7 +967,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
             if response.status_code == 200:
                 try:
-                    return response.json()
+                    return _parse_json(response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             elif response.status_code == 404:
@@ -967,7 +1023,7 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
+            response = self.session.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
             if response.status_code == 502:
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
@@ -994,7 +1050,7 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.get(url, headers=headers)
+            response = self.session.get(url, headers=headers)
             if response.status_code == 502:
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
@@ -1021,7 +1077,7 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.delete(url, headers=headers)
+            response = self.session.delete(url, headers=headers)
             if response.status_code == 502:
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
@@ -1035,20 +1091,23 @@ class FirecrawlApp:
         Args:
             id (str): The ID of the crawl job.
             headers (Dict[str, str]): The headers to include in the status check requests.
-            poll_interval (int): Secounds between status checks.
+            poll_interval (int): Longest time in seconds between status checks, if above JOB_POLL_MAX_DELAY.
         Returns:
             Any: The crawl results if the job is completed successfully.
 
         Raises:
             Exception: If the job fails or an error occurs during status checks.
         """
+        # Check short jobs quickly, then back off so long jobs need few status requests
+        delay = JOB_POLL_INITIAL_DELAY
+        max_delay = max(poll_interval, JOB_POLL_MAX_DELAY)
         while True:
             api_url = f'{self.api_url}/v1/crawl/{id}'
 
             status_response = self._get_request(api_url, headers)
             if status_response.status_code == 200:
                 try:
-                    status_data = status_response.json()
+                    status_data = _parse_json(status_response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if status_data['status'] == 'completed':
@@ -1059,7 +1118,7 @@ class FirecrawlApp:
                                 break
                             status_response = self._get_request(status_data['next'], headers)
                             try:
-                                status_data = status_response.json()
+                                status_data = _parse_json(status_response)
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             data.extend(status_data.get('data', []))
@@ -1068,8 +1127,8 @@ class FirecrawlApp:
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
-                    poll_interval=max(poll_interval,2)
-                    time.sleep(poll_interval)  # Wait for the specified interval before checking again
+                    time.sleep(delay)  # Wait before checking again
+                    delay = min(delay * 2, max_delay)
                 else:
                     raise Exception(f'Crawl job failed or was stopped. Status: {status_data["status"]}')
             else:
@@ -1087,8 +1146,8 @@ class FirecrawlApp:
             Exception: An exception with a message containing the status code and error details from the response.
         """
         try:
-            error_message = response.json().get('error', 'No error message provided.')
-            error_details = response.json().get('details', 'No additional error details provided.')
+            error_message = _parse_json(response).get('error', 'No error message provided.')
+            error_details = _parse_json(response).get('details', 'No additional error details provided.')
         except:
             raise requests.exceptions.HTTPError(f'Failed to parse Firecrawl error response as JSON. Status code: {response.status_code}', response=response)
         
@@ -0,0 +1,236 @@
+"""
+Semantic Cache Module
+
+This module provides the in-memory caches used by the DeepResearchAgent to avoid
+repeating web searches, URL extractions and whole research runs. Lookups first try
+an exact match on the normalized text and then fall back to embedding similarity,
+so near-identical questions can reuse earlier results without any network I/O.
+
+Classes:
+    - TTLCache: Bounded exact-match cache with optional per-entry expiry.
+    - SemanticCache: Exact-match cache with an embedding similarity fallback.
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Async function returning one embedding vector per input text
+EmbedFunction = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+_MISSING = object()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for exact-match cache keys.
+
+    Args:
+        text: The text to normalize
+
+    Returns:
+        Lowercased text with collapsed whitespace
+    """
+    return " ".join(text.lower().split())
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    """
+    Compute the cosine similarity between two vectors.
+
+    Args:
+        a: The first vector
+        b: The second vector
+
+    Returns:
+        Cosine similarity in the range [-1, 1] (0 if either vector is zero)
+    """
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if not norm:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / norm
+
+
+class TTLCache:
+    """
+    A bounded least-recently-used cache whose entries can expire after a fixed time.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Time to live of each entry in seconds (None means entries never expire)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            The cached value or the default
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: The cache key
+            value: The value to store
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else math.inf
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache"""
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        # Membership tests must not count as a use, so the entry is not moved
+        entry = self._data.get(key, _MISSING)
+        return entry is not _MISSING and entry[0] >= time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """
+    A cache keyed by text that also matches semantically similar text.
+
+    Entries are looked up by exact normalized text first. On a miss, the text is
+    embedded and compared against the stored entries with cosine similarity; the most
+    similar entry above the threshold is returned.
+    """
+
+    def __init__(self, embed: EmbedFunction, threshold: float = 0.92, maxsize: int = 256, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Async function that embeds a list of texts
+            threshold: Minimum cosine similarity for a semantic match
+            maxsize: Maximum number of entries to keep
+            ttl: Time to live of each entry in seconds (None means entries never expire)
+        """
+        self.threshold = threshold
+        self._embed = embed
+        self._values = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._vectors: "OrderedDict[Tuple[Hashable, str], List[float]]" = OrderedDict()
+        self._embeddings = TTLCache(maxsize=maxsize)
+
+    async def get(self, text: str, scope: Hashable = None) -> Optional[Any]:
+        """
+        Get the cached value for the text or for the most similar cached text.
+
+        Args:
+            text: The text to look up
+            scope: Only entries stored with the same scope can match
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        key = (scope, normalize_text(text))
+        value = self._values.get(key)
+        if value is not None:
+            return value
+
+        candidates = [(k, v) for k, v in self._vectors.items() if k[0] == scope]
+        if not candidates:
+            return None
+
+        vector = await self._embedding(key[1])
+        if vector is None:
+            return None
+
+        best_key, best_score = None, self.threshold
+        for candidate_key, candidate_vector in candidates:
+            score = sum(a * b for a, b in zip(vector, candidate_vector))
+            if score >= best_score:
+                best_key, best_score = candidate_key, score
+
+        if best_key is None:
+            return None
+
+        logger.debug("Semantic cache match (%.3f) for: %s", best_score, text)
+        return self._values.get(best_key)
+
+    async def set(self, text: str, value: Any, scope: Hashable = None) -> None:
+        """
+        Store a value for the text.
+
+        Args:
+            text: The text the value was computed for
+            value: The value to store
+            scope: Scope the entry belongs to
+        """
+        key = (scope, normalize_text(text))
+        self._values.set(key, value)
+
+        vector = await self._embedding(key[1])
+        if vector is not None:
+            self._vectors[key] = vector
+            self._vectors.move_to_end(key)
+
+        # Drop vectors whose values have been evicted or expired
+        if len(self._vectors) > self._values.maxsize:
+            for stale_key in [k for k in self._vectors if k not in self._values]:
+                del self._vectors[stale_key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache"""
+        self._values.clear()
+        self._vectors.clear()
+
+    async def _embedding(self, text: str) -> Optional[List[float]]:
+        """
+        Get the unit-length embedding of a normalized text, reusing earlier embeddings.
+
+        Args:
+            text: The normalized text
+
+        Returns:
+            The embedding vector, or None if the embedding request failed
+        """
+        vector = self._embeddings.get(text)
+        if vector is not None:
+            return vector
+
+        try:
+            vector = (await self._embed([text]))[0]
+        except Exception as e:
+            logger.warning("Embedding failed, using exact-match cache only: %s", e)
+            return None
+
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        vector = [x / norm for x in vector]
+        self._embeddings.set(text, vector)
+        return vector
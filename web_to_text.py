@@ -9,15 +9,218 @@ Classes:
     - WebToTextExtractor: Main class for extracting web content in LLM-friendly formats.
 """
 
+import asyncio
+import copy
+import hashlib
+import io
 import logging
 import json
-from typing import Any, Dict, List, Optional, Union, Tuple
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import os
 
 from .firecrawl import FirecrawlApp, SearchParams
 
 logger = logging.getLogger("firecrawl.web_to_text")
 
+# Maximum number of concurrent scrape requests when extracting pages one by one
+MAX_CONCURRENT_SCRAPES = 8
+
+# Cache of extracted pages, so URLs seen again within a session are not re-scraped
+SCRAPE_CACHE_MAX_ENTRIES = 512
+SCRAPE_CACHE_TTL_SECONDS = 600
+
+# FirecrawlApp instances shared by extractors with the same credentials, so they
+# share one HTTP connection pool. Keyed by (api_url, sha256 of the api_key).
+_APP_CACHE: Dict[Tuple[str, str], FirecrawlApp] = {}
+_APP_CACHE_LOCK = threading.Lock()
+
+# Output formats supported by the scrape API
+_VALID_FORMATS = frozenset({'markdown', 'html', 'rawHtml', 'links', 'json', 'screenshot', 'screenshot@fullPage', 'extract'})
+
+# Top-level keys of a processed scrape result, in output order
+_PRIMARY_KEYS = ('markdown', 'text', 'metadata', 'summary')
+# Metadata fields kept in a processed scrape result
+_METADATA_FIELDS = ('title', 'description', 'author', 'date')
+# Keys that are handled explicitly (or dropped) when processing a scrape result
+_CANONICAL_KEYS = frozenset(_PRIMARY_KEYS) | {'success', 'error'}
+
+# Query parameters that only track the visitor and do not change the page
+_TRACKING_PARAMS = frozenset({'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref_src'})
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Blocks written around each result by combine_results_for_llm
+_RESULT_SEPARATOR = f"\n{'=' * 80}\n\n"
+_HEADER_TMPL = "# {title}\n\nURL: {url}\n\n{description}{author}{date}\n\n"
+# Optional header lines, rendered only when the metadata field has a value
+_HEADER_OPTIONAL_FIELDS = (('description', 'Description'), ('author', 'Author'), ('date', 'Date'))
+
+# Patterns used to extract basic metadata from markdown content
+_TITLE_RE = re.compile(r'# (.*?)(\n|$)')
+_DESC_RE = re.compile(r'\n\n(.*?)(\n\n|$)')
+
+# Number of leading characters of a document scanned for metadata
+METADATA_SCAN_CHARS = 8192
+
+def _search_head(pattern: 're.Pattern', text: str) -> Optional['re.Match']:
+    """
+    Search for a pattern in the start of the text, scanning the full text only when needed.
+    
+    A match found in the first METADATA_SCAN_CHARS characters is used as long as it
+    does not touch the end of that slice, where the cut could have shortened it.
+    Otherwise the search is repeated on the full text, so the result is always the
+    same as pattern.search(text).
+    
+    Args:
+        pattern (re.Pattern): The compiled pattern
+        text (str): The text to search
+        
+    Returns:
+        Optional[re.Match]: The first match, or None
+    """
+    if len(text) <= METADATA_SCAN_CHARS:
+        return pattern.search(text)
+    
+    match = pattern.search(text, 0, METADATA_SCAN_CHARS)
+    if match and match.end() <= METADATA_SCAN_CHARS - 2:
+        return match
+    return pattern.search(text)
+
+def _validate_formats(formats: List[str]) -> List[str]:
+    """
+    Keep only the formats supported by the API, defaulting to markdown.
+    
+    Args:
+        formats (List[str]): The requested formats
+        
+    Returns:
+        List[str]: The supported formats, or ['markdown'] if none are supported
+    """
+    return [fmt for fmt in formats if fmt in _VALID_FORMATS] or ['markdown']
+
+def _shared_app(api_key: Optional[str], api_url: Optional[str]) -> FirecrawlApp:
+    """
+    Get the shared FirecrawlApp for the given credentials, creating it on first use.
+    
+    Args:
+        api_key (Optional[str]): API key for Firecrawl. If None, the FIRECRAWL_API_KEY env var is used.
+        api_url (Optional[str]): API URL for Firecrawl. If None, the FIRECRAWL_API_URL env var or the default is used.
+        
+    Returns:
+        FirecrawlApp: The shared FirecrawlApp instance
+    """
+    # Resolve the credentials the same way FirecrawlApp does, so equivalent calls share an instance
+    resolved_key = api_key or os.getenv('FIRECRAWL_API_KEY') or ''
+    resolved_url = api_url or os.getenv('FIRECRAWL_API_URL') or ''
+    key = (resolved_url, hashlib.sha256(resolved_key.encode()).hexdigest())
+    
+    with _APP_CACHE_LOCK:
+        app = _APP_CACHE.get(key)
+        if app is None:
+            app = _APP_CACHE[key] = FirecrawlApp(api_key=api_key, api_url=api_url)
+        return app
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that variants of the same page compare equal.
+    
+    Lowercases the scheme and host, drops default ports, tracking query parameters,
+    the fragment and any trailing slash.
+    
+    Args:
+        url (str): The URL to normalize
+        
+    Returns:
+        str: The normalized URL, or the URL unchanged if it cannot be parsed
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        # Malformed URLs (e.g. an unclosed IPv6 bracket) are kept as they are
+        return url
+    scheme = parts.scheme.lower()
+    
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = (parts.hostname or '').lower()
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in _TRACKING_PARAMS and not key.startswith('utm_')
+    ])
+    return urlunsplit((scheme, netloc, parts.path.rstrip('/'), query, ''))
+
+class _ExtractionCache:
+    """
+    A thread-safe least-recently-used cache of extraction results that expire after a fixed time.
+    
+    Values are deep-copied on the way in and out, since callers add keys to the
+    returned results and must not change the cached entries.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize (int): Maximum number of entries to keep
+            ttl (float): Time to live of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a cached result.
+        
+        Args:
+            key (Any): The cache key
+            
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the cached result, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+        return copy.deepcopy(value)
+    
+    def set(self, key: Any, value: Dict[str, Any]) -> None:
+        """
+        Store a copy of a result, evicting the least recently used entry if the cache is full.
+        
+        Args:
+            key (Any): The cache key
+            value (Dict[str, Any]): The result to store
+        """
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache"""
+        with self._lock:
+            self._data.clear()
+
 class WebToTextExtractor:
     """
     A class for extracting web content and converting it to formats suitable for LLMs.
@@ -29,7 +232,8 @@ class WebToTextExtractor:
     - Perform deep research on a topic across multiple sources
     """
     
-    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None, use_local_docker: bool = False):
+    def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None, use_local_docker: bool = False,
+                 share_app: bool = True):
         """
         Initialize the WebToTextExtractor with the given API credentials.
         
@@ -39,6 +243,8 @@ class WebToTextExtractor:
             api_url (Optional[str]): API URL for Firecrawl. If None, will use default.
             use_local_docker (bool): If True, will use a local Docker instance instead of the cloud service.
                                     This will override api_url to http://localhost:3002 if not specified.
+            share_app (bool): If True, extractors with the same credentials share one FirecrawlApp and its
+                                    connection pool. Set to False for an isolated HTTP session.
         """
         # If using local Docker and no api_url is specified, use localhost:3002
         if use_local_docker and not api_url:
@@ -47,12 +253,26 @@ class WebToTextExtractor:
         
         # Initialize FirecrawlApp
         # When using local Docker, api_key is optional
-        self.app = FirecrawlApp(api_key=api_key, api_url=api_url)
+        if share_app:
+            self.app = _shared_app(api_key, api_url)
+        else:
+            self.app = FirecrawlApp(api_key=api_key, api_url=api_url)
         
         # Store configuration
         self.use_local_docker = use_local_docker
         self.api_url = api_url or self.app.api_url
         
+        # Scrape parameters that only depend on the configuration.
+        # The local Docker API (v1) needs validated formats, and onlyMainContent
+        # helps get cleaner content; the cloud API (v1) takes the formats as given.
+        self._param_defaults = {'onlyMainContent': True} if use_local_docker else {}
+        self._validate_docker_formats = use_local_docker
+        # Scrape params without the timeout, built once per requested formats
+        self._params_templates: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        
+        # Extracted pages keyed by (url, formats, timeout)
+        self._scrape_cache = _ExtractionCache(maxsize=SCRAPE_CACHE_MAX_ENTRIES, ttl=SCRAPE_CACHE_TTL_SECONDS)
+        
         logger.debug(f"WebToTextExtractor initialized with API URL: {self.api_url}")
         
     def extract_from_url(self, url: str, 
@@ -69,31 +289,13 @@ class WebToTextExtractor:
         Returns:
             Dict[str, Any]: Dictionary containing the extracted content in requested formats
         """
-        # Validate formats to ensure they're compatible with the API
-        valid_formats = ['markdown', 'html', 'rawHtml', 'links', 'json', 'screenshot', 'screenshot@fullPage', 'extract']
-        validated_formats = [fmt for fmt in formats if fmt in valid_formats]
-        
-        if not validated_formats:
-            # Default to markdown if no valid formats provided
-            validated_formats = ['markdown']
+        cache_key = self._cache_key(url, formats, timeout)
+        cached = self._cached_extraction(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached content for URL: {url}")
+            return cached
         
-        # Create params based on whether we're using local Docker or not
-        if self.use_local_docker:
-            # Parameters for local Docker API (v1)
-            params = {
-                'formats': validated_formats,
-                'timeout': timeout,
-                'onlyMainContent': True  # This helps get cleaner content
-            }
-            
-            logger.debug(f"Using Docker API params: {params}")
-        else:
-            # Parameters for cloud API (v1)
-            params = {
-                'formats': formats,
-                'timeout': timeout
-            }
-            logger.debug(f"Using Cloud API params: {params}")
+        params = self._scrape_params(formats, timeout)
         
         try:
             logger.info(f"Extracting content from URL: {url}")
@@ -102,12 +304,78 @@ class WebToTextExtractor:
             # Process the result to make it more LLM-friendly
             processed_result = self._process_scrape_result(result)
             
+            self._cache_extraction(cache_key, processed_result)
             return processed_result
             
         except Exception as e:
             logger.error(f"Error extracting content from URL {url}: {str(e)}")
             raise
     
+    def invalidate_cache(self) -> None:
+        """
+        Discard all cached extraction results, so the next extractions fetch fresh content.
+        """
+        self._scrape_cache.clear()
+    
+    def _cache_key(self, url: str, formats: List[str], timeout: int) -> Tuple[str, Tuple[str, ...], int]:
+        """
+        Build the cache key of an extraction.
+        
+        Args:
+            url (str): The extracted URL
+            formats (List[str]): The requested formats
+            timeout (int): Timeout in milliseconds
+            
+        Returns:
+            Tuple[str, Tuple[str, ...], int]: The cache key
+        """
+        return (url, tuple(sorted(formats)), timeout)
+    
+    def _cached_extraction(self, cache_key: Tuple[str, Tuple[str, ...], int]) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached extraction result.
+        
+        Args:
+            cache_key (Tuple[str, Tuple[str, ...], int]): The cache key
+            
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the cached result (callers add keys to it), or None
+        """
+        return self._scrape_cache.get(cache_key)
+    
+    def _cache_extraction(self, cache_key: Tuple[str, Tuple[str, ...], int], result: Dict[str, Any]) -> None:
+        """
+        Store an extraction result in the cache.
+        
+        Args:
+            cache_key (Tuple[str, Tuple[str, ...], int]): The cache key
+            result (Dict[str, Any]): The processed extraction result
+        """
+        self._scrape_cache.set(cache_key, result)
+    
+    def _scrape_params(self, formats: List[str], timeout: int) -> Dict[str, Any]:
+        """
+        Build the scrape parameters for the configured API.
+        
+        Args:
+            formats (List[str]): List of formats to extract
+            timeout (int): Timeout in milliseconds
+            
+        Returns:
+            Dict[str, Any]: Parameters for a scrape or batch scrape request
+        """
+        formats_key = tuple(formats)
+        template = self._params_templates.get(formats_key)
+        if template is None:
+            # Validate formats to ensure they're compatible with the Docker API
+            validated_formats = _validate_formats(formats) if self._validate_docker_formats else list(formats)
+            template = self._params_templates[formats_key] = {**self._param_defaults, 'formats': validated_formats}
+        
+        params = {**template, 'timeout': timeout}
+        logger.debug(f"Using scrape params: {params}")
+        
+        return params
+    
     def _extract_metadata_from_markdown(self, markdown_content: str) -> Dict[str, str]:
         """
         Extract basic metadata from markdown content.
@@ -121,13 +389,12 @@ class WebToTextExtractor:
         metadata = {}
         
         # Try to extract title (first heading)
-        import re
-        title_match = re.search(r'# (.*?)(\n|$)', markdown_content)
+        title_match = _search_head(_TITLE_RE, markdown_content)
         if title_match:
             metadata['title'] = title_match.group(1).strip()
         
         # Try to extract description (first paragraph)
-        desc_match = re.search(r'\n\n(.*?)(\n\n|$)', markdown_content)
+        desc_match = _search_head(_DESC_RE, markdown_content)
         if desc_match:
             metadata['description'] = desc_match.group(1).strip()
         
@@ -151,23 +418,18 @@ class WebToTextExtractor:
         if 'text' in result:
             processed['text'] = result['text']
             
-        # Include metadata in a structured format
-        if 'metadata' in result:
-            processed['metadata'] = {
-                'title': result['metadata'].get('title', ''),
-                'description': result['metadata'].get('description', ''),
-                'author': result['metadata'].get('author', ''),
-                'date': result['metadata'].get('date', '')
-            }
+        # Include metadata in a structured format, leaving out empty fields
+        metadata = result.get('metadata') or {}
+        structured_metadata = {field: metadata[field] for field in _METADATA_FIELDS if metadata.get(field)}
+        if structured_metadata:
+            processed['metadata'] = structured_metadata
             
         # Include a summary if available
         if 'summary' in result:
             processed['summary'] = result['summary']
             
-        # Include other formats if requested
-        for key in result:
-            if key not in processed and key not in ['success', 'error']:
-                processed[key] = result[key]
+        # Include other formats if requested (the primary keys were added above)
+        processed.update({key: value for key, value in result.items() if key not in _CANONICAL_KEYS})
                 
         return processed
     
@@ -189,15 +451,92 @@ class WebToTextExtractor:
         Returns:
             List[Dict[str, Any]]: List of dictionaries containing extracted content from each result
         """
-        # Validate formats for Docker API if needed
-        if self.use_local_docker:
-            valid_formats = ['markdown', 'html', 'rawHtml', 'links', 'json', 'screenshot', 'screenshot@fullPage', 'extract']
-            validated_formats = [fmt for fmt in formats if fmt in valid_formats]
-            if not validated_formats:
-                validated_formats = ['markdown']
-        else:
-            validated_formats = formats
+        return list(self.iter_search_and_extract(query, limit, formats, country, lang))
+    
+    def iter_search_and_extract(self, query: str, 
+                                limit: int = 5,
+                                formats: List[str] = ['markdown'],
+                                country: str = 'us',
+                                lang: str = 'en') -> Iterator[Dict[str, Any]]:
+        """
+        Generator version of search_and_extract that hands the results over one at a time.
+        
+        The pages are scraped with one batch scrape job, which returns them all at
+        once, so the first result is only yielded after every page is extracted. Only
+        when the batch scrape fails, and the pages are scraped in a thread pool, is
+        each result yielded as soon as it (and the results before it) is extracted.
+        
+        Args:
+            query (str): The search query
+            limit (int): Maximum number of results to return
+            formats (List[str]): List of formats to extract from each result
+            country (str): Country code for search
+            lang (str): Language code for search
             
+        Yields:
+            Dict[str, Any]: The extracted content of each result
+        """
+        validated_formats = self._api_formats(formats)
+        
+        try:
+            search_results = self._search(query, limit, country, lang)
+            extracted = self._iter_extract_many([result['url'] for result in search_results], validated_formats)
+            
+            for content, result in zip(extracted, search_results):
+                if content is not None:
+                    yield self._with_search_metadata(content, result)
+            
+        except Exception as e:
+            logger.error(f"Error in search_and_extract: {str(e)}")
+            raise
+    
+    async def asearch_and_extract(self, query: str, 
+                                  limit: int = 5,
+                                  formats: List[str] = ['markdown'],
+                                  country: str = 'us',
+                                  lang: str = 'en') -> List[Dict[str, Any]]:
+        """
+        Async version of search_and_extract that extracts content from all results concurrently.
+        
+        Args:
+            query (str): The search query
+            limit (int): Maximum number of results to return
+            formats (List[str]): List of formats to extract from each result
+            country (str): Country code for search
+            lang (str): Language code for search
+            
+        Returns:
+            List[Dict[str, Any]]: List of dictionaries containing extracted content from each result
+        """
+        validated_formats = self._api_formats(formats)
+        
+        try:
+            search_results = await asyncio.to_thread(self._search, query, limit, country, lang)
+            extracted = await self._aextract_many([result['url'] for result in search_results], validated_formats)
+            
+            return [
+                self._with_search_metadata(content, result)
+                for content, result in zip(extracted, search_results)
+                if content is not None
+            ]
+            
+        except Exception as e:
+            logger.error(f"Error in asearch_and_extract: {str(e)}")
+            raise
+    
+    def _search(self, query: str, limit: int, country: str, lang: str) -> List[Dict[str, Any]]:
+        """
+        Run a search and return the results that have a URL.
+        
+        Args:
+            query (str): The search query
+            limit (int): Maximum number of results to return
+            country (str): Country code for search
+            lang (str): Language code for search
+            
+        Returns:
+            List[Dict[str, Any]]: The search results, or an empty list if the search failed
+        """
         search_params = SearchParams(
             query=query,
             limit=limit,
@@ -205,44 +544,171 @@ class WebToTextExtractor:
             lang=lang
         )
         
+        logger.info(f"Searching for: {query}")
+        search_results = self.app.search(query, params=search_params)
+        
+        if not search_results.get('success', False) or 'data' not in search_results:
+            logger.error(f"Search failed: {search_results.get('error', 'Unknown error')}")
+            return []
+        
+        return [result for result in search_results['data'] if result.get('url')]
+    
+    def _with_search_metadata(self, extracted: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add search result metadata to an extraction result.
+        
+        Args:
+            extracted (Dict[str, Any]): The extraction result
+            result (Dict[str, Any]): The search result it was extracted from
+            
+        Returns:
+            Dict[str, Any]: The extraction result with a 'search_metadata' entry
+        """
+        extracted['search_metadata'] = {
+            'title': result.get('title', ''),
+            'snippet': result.get('snippet', ''),
+            'url': result['url']
+        }
+        return extracted
+    
+    def _iter_extract_many(self, urls: List[str], formats: List[str]) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Extract content from several URLs with a single batch scrape job.
+        
+        Falls back to scraping the URLs concurrently in a thread pool if the batch scrape fails.
+        
+        Args:
+            urls (List[str]): The URLs to extract content from
+            formats (List[str]): List of formats to extract
+            
+        Yields:
+            Optional[Dict[str, Any]]: Extraction results in the order of urls (None for failed URLs)
+        """
+        if not urls:
+            return
+        
         try:
-            logger.info(f"Searching for: {query}")
-            search_results = self.app.search(query, params=search_params)
+            extracted_results = self._batch_extract(urls, formats)
+        except Exception as e:
+            logger.warning(f"Batch scrape failed, extracting URLs concurrently: {str(e)}")
+        else:
+            # Hand the results over one at a time so the caller can release each of them
+            extracted_results.reverse()
+            while extracted_results:
+                yield extracted_results.pop()
+            return
+        
+        # Scraping is network-bound, so threads overlap the requests; map keeps the order of urls
+        executor = ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENT_SCRAPES))
+        try:
+            yield from executor.map(lambda url: self._try_extract(url, formats), urls)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _try_extract(self, url: str, formats: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Extract content from a URL, logging failures instead of raising them.
+        
+        Args:
+            url (str): The URL to extract content from
+            formats (List[str]): List of formats to extract
             
-            if not search_results.get('success', False) or 'data' not in search_results:
-                logger.error(f"Search failed: {search_results.get('error', 'Unknown error')}")
-                return []
-                
-            extracted_results = []
-            for result in search_results['data']:
-                url = result.get('url')
-                if not url:
-                    continue
-                    
-                try:
-                    # Use our updated extract_from_url method which handles Docker compatibility
-                    # Only pass formats parameter to avoid issues with API v1
-                    extracted = self.extract_from_url(url, formats=validated_formats)
-                    # Add search result metadata
-                    extracted['search_metadata'] = {
-                        'title': result.get('title', ''),
-                        'snippet': result.get('snippet', ''),
-                        'url': url
-                    }
-                    extracted_results.append(extracted)
-                except Exception as e:
-                    logger.warning(f"Failed to extract content from {url}: {str(e)}")
-                    
+        Returns:
+            Optional[Dict[str, Any]]: The extracted content, or None if the extraction failed
+        """
+        try:
+            # Use our updated extract_from_url method which handles Docker compatibility
+            # Only pass formats parameter to avoid issues with API v1
+            return self.extract_from_url(url, formats=formats)
+        except Exception as e:
+            logger.warning(f"Failed to extract content from {url}: {str(e)}")
+            return None
+    
+    def _batch_extract(self, urls: List[str], formats: List[str],
+                       timeout: int = 60000) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract content from several URLs with a single batch scrape job.
+        
+        Args:
+            urls (List[str]): The URLs to extract content from
+            formats (List[str]): List of formats to extract
+            timeout (int): Timeout in milliseconds for each page
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: Extraction results in the order of urls (None for pages the job did not return)
+        """
+        cache_keys = [self._cache_key(url, formats, timeout) for url in urls]
+        extracted_results = [self._cached_extraction(cache_key) for cache_key in cache_keys]
+        
+        # Only scrape the URLs that are not cached
+        missing_urls = list(dict.fromkeys(url for url, extracted in zip(urls, extracted_results) if extracted is None))
+        if not missing_urls:
             return extracted_results
+        
+        params = self._scrape_params(formats, timeout)
+        
+        logger.info(f"Batch extracting content from {len(missing_urls)} URLs")
+        batch_result = self.app.batch_scrape_urls(missing_urls, params=params)
+        pages = batch_result.get('data', []) if isinstance(batch_result, dict) else []
+        
+        # Pages may come back in any order, so match them to the requested URLs
+        pages_by_url = {}
+        for page in pages:
+            metadata = page.get('metadata') or {}
+            source_url = metadata.get('sourceURL') or metadata.get('url')
+            if source_url:
+                pages_by_url.setdefault(source_url.rstrip('/'), page)
+        if not pages_by_url and len(pages) == len(missing_urls):
+            pages_by_url = {url.rstrip('/'): page for url, page in zip(missing_urls, pages)}
+        
+        processed_pages = {}
+        for url in missing_urls:
+            page = pages_by_url.get(url.rstrip('/'))
+            if page is None:
+                logger.warning(f"Batch scrape returned no content for {url}")
+            else:
+                processed_pages[url] = self._process_scrape_result(page)
+                self._cache_extraction(self._cache_key(url, formats, timeout), processed_pages[url])
+        
+        for i, url in enumerate(urls):
+            if extracted_results[i] is None and url in processed_pages:
+                extracted_results[i] = copy.deepcopy(processed_pages[url])
+        return extracted_results
+    
+    async def _aextract_many(self, urls: List[str], formats: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract content from several URLs with a single batch scrape job.
+        
+        Falls back to scraping the URLs concurrently if the batch scrape fails.
+        
+        Args:
+            urls (List[str]): The URLs to extract content from
+            formats (List[str]): List of formats to extract
             
+        Returns:
+            List[Optional[Dict[str, Any]]]: Extraction results in the order of urls (None for failed URLs)
+        """
+        if not urls:
+            return []
+        
+        try:
+            return await asyncio.to_thread(self._batch_extract, urls, formats)
         except Exception as e:
-            logger.error(f"Error in search_and_extract: {str(e)}")
-            raise
+            logger.warning(f"Batch scrape failed, extracting URLs concurrently: {str(e)}")
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        
+        async def extract(url: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await asyncio.to_thread(self._try_extract, url, formats)
+        
+        return await asyncio.gather(*[extract(url) for url in urls])
     
     def map_website_and_extract(self, url: str, 
                                search_term: Optional[str] = None,
                                max_pages: int = 5,
-                               formats: List[str] = ['markdown']) -> List[Dict[str, Any]]:
+                               formats: List[str] = ['markdown'],
+                               use_crawl: bool = True) -> List[Dict[str, Any]]:
         """
         Map a website to find relevant pages and extract content from them.
         
@@ -251,57 +717,203 @@ class WebToTextExtractor:
             search_term (Optional[str]): Term to search for within the website
             max_pages (int): Maximum number of pages to extract
             formats (List[str]): List of formats to extract from each page
+            use_crawl (bool): If True and no search_term is given, discover and scrape the pages with a
+                              single crawl job instead of mapping the website and scraping the pages.
+                              A crawl follows links from url, so it can return different pages than
+                              the map; pass False to keep the map-based page selection.
             
         Returns:
             List[Dict[str, Any]]: List of dictionaries containing extracted content from each page
         """
-        # Validate formats for Docker API if needed
-        if self.use_local_docker:
-            valid_formats = ['markdown', 'html', 'rawHtml', 'links', 'json', 'screenshot', 'screenshot@fullPage', 'extract']
-            validated_formats = [fmt for fmt in formats if fmt in valid_formats]
-            if not validated_formats:
-                validated_formats = ['markdown']
-        else:
-            validated_formats = formats
+        return list(self.iter_map_website_and_extract(url, search_term, max_pages, formats, use_crawl))
+    
+    def iter_map_website_and_extract(self, url: str, 
+                                     search_term: Optional[str] = None,
+                                     max_pages: int = 5,
+                                     formats: List[str] = ['markdown'],
+                                     use_crawl: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Generator version of map_website_and_extract that hands the pages over one at a time.
+        
+        The crawl job and the batch scrape job return all pages at once, so the first
+        page is only yielded after every page is extracted. Only when the batch scrape
+        fails, and the pages are scraped in a thread pool, is each page yielded as soon
+        as it (and the pages before it) is extracted.
+        
+        Args:
+            url (str): The base URL of the website
+            search_term (Optional[str]): Term to search for within the website
+            max_pages (int): Maximum number of pages to extract
+            formats (List[str]): List of formats to extract from each page
+            use_crawl (bool): If True and no search_term is given, use a single crawl job
+            
+        Yields:
+            Dict[str, Any]: The extracted content of each page
+        """
+        validated_formats = self._api_formats(formats)
             
         try:
-            logger.info(f"Mapping website: {url} with search term: {search_term}")
+            # The crawl endpoint cannot filter by search term, so mapping is still needed for that
+            if use_crawl and not search_term:
+                pages = self._crawl(url, max_pages, validated_formats)
+                if pages is not None:
+                    yield from pages
+                    return
             
-            # Map the website
-            map_params = {}
-            if search_term:
-                map_params['search'] = search_term
-                
-            map_result = self.app.map_url(url, params=map_params)
-            
-            # Extract URLs from the map result
-            urls = []
-            if isinstance(map_result, dict) and 'urls' in map_result:
-                urls = map_result['urls']
-            elif isinstance(map_result, list):
-                urls = map_result
-                
-            # Limit the number of pages
-            urls = urls[:max_pages]
+            urls = self._map(url, search_term, max_pages)
+            extracted = self._iter_extract_many(urls, validated_formats)
+            
+            for page_url, content in zip(urls, extracted):
+                if content is not None:
+                    content['url'] = page_url
+                    yield content
+            
+        except Exception as e:
+            logger.error(f"Error in map_website_and_extract: {str(e)}")
+            raise
+    
+    async def amap_website_and_extract(self, url: str, 
+                                       search_term: Optional[str] = None,
+                                       max_pages: int = 5,
+                                       formats: List[str] = ['markdown'],
+                                       use_crawl: bool = True) -> List[Dict[str, Any]]:
+        """
+        Async version of map_website_and_extract that extracts content from all pages concurrently.
+        
+        Args:
+            url (str): The base URL of the website
+            search_term (Optional[str]): Term to search for within the website
+            max_pages (int): Maximum number of pages to extract
+            formats (List[str]): List of formats to extract from each page
+            use_crawl (bool): If True and no search_term is given, use a single crawl job
+            
+        Returns:
+            List[Dict[str, Any]]: List of dictionaries containing extracted content from each page
+        """
+        validated_formats = self._api_formats(formats)
+        
+        try:
+            if use_crawl and not search_term:
+                pages = await asyncio.to_thread(self._crawl, url, max_pages, validated_formats)
+                if pages is not None:
+                    return pages
+            
+            urls = await asyncio.to_thread(self._map, url, search_term, max_pages)
+            extracted = await self._aextract_many(urls, validated_formats)
             
-            # Extract content from each URL
             extracted_results = []
-            for page_url in urls:
-                try:
-                    # Use our updated extract_from_url method which handles Docker compatibility
-                    # Only pass formats parameter to avoid issues with API v1
-                    extracted = self.extract_from_url(page_url, formats=validated_formats)
-                    extracted['url'] = page_url
-                    extracted_results.append(extracted)
-                except Exception as e:
-                    logger.warning(f"Failed to extract content from {page_url}: {str(e)}")
-                    
+            for page_url, content in zip(urls, extracted):
+                if content is not None:
+                    content['url'] = page_url
+                    extracted_results.append(content)
             return extracted_results
             
         except Exception as e:
-            logger.error(f"Error in map_website_and_extract: {str(e)}")
+            logger.error(f"Error in amap_website_and_extract: {str(e)}")
             raise
     
+    def _crawl(self, url: str, max_pages: int, formats: List[str],
+               timeout: int = 60000) -> Optional[List[Dict[str, Any]]]:
+        """
+        Discover and extract the pages of a website with a single crawl job.
+        
+        Args:
+            url (str): The base URL of the website
+            max_pages (int): Maximum number of pages to extract
+            formats (List[str]): List of formats to extract from each page
+            timeout (int): Timeout in milliseconds for each page
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: The extracted pages, or None if the crawl failed or returned no pages
+        """
+        crawl_params = {
+            'limit': max_pages,
+            'scrapeOptions': self._scrape_params(formats, timeout)
+        }
+        
+        try:
+            logger.info(f"Crawling website: {url}")
+            crawl_result = self.app.crawl_url(url, params=crawl_params)
+        except Exception as e:
+            logger.warning(f"Crawl failed, mapping website instead: {str(e)}")
+            return None
+        
+        pages = crawl_result.get('data') if isinstance(crawl_result, dict) else None
+        if not pages:
+            logger.warning(f"Crawl returned no pages, mapping website instead: {url}")
+            return None
+        
+        extracted_results = []
+        seen_urls = set()
+        for page in pages:
+            metadata = page.get('metadata') or {}
+            page_url = metadata.get('sourceURL') or metadata.get('url') or url
+            
+            # Skip variants of pages already extracted
+            normalized_url = _normalize_url(page_url)
+            if normalized_url in seen_urls:
+                continue
+            seen_urls.add(normalized_url)
+            
+            content = self._process_scrape_result(page)
+            self._cache_extraction(self._cache_key(page_url, formats, timeout), content)
+            content['url'] = page_url
+            extracted_results.append(content)
+            
+            if len(extracted_results) >= max_pages:
+                break
+        
+        return extracted_results
+    
+    def _map(self, url: str, search_term: Optional[str], max_pages: int) -> List[str]:
+        """
+        Map a website and return the URLs of its most relevant pages.
+        
+        Args:
+            url (str): The base URL of the website
+            search_term (Optional[str]): Term to search for within the website
+            max_pages (int): Maximum number of URLs to return
+            
+        Returns:
+            List[str]: The discovered page URLs
+        """
+        logger.info(f"Mapping website: {url} with search term: {search_term}")
+        
+        # Map the website
+        map_params = {}
+        if search_term:
+            map_params['search'] = search_term
+            
+        map_result = self.app.map_url(url, params=map_params)
+        
+        # Extract URLs from the map result
+        urls = []
+        if isinstance(map_result, dict) and 'urls' in map_result:
+            urls = map_result['urls']
+        elif isinstance(map_result, list):
+            urls = map_result
+            
+        # Drop duplicate pages (keeping the first URL seen for each), then limit the number of pages
+        unique_urls = {}
+        for page_url in urls:
+            unique_urls.setdefault(_normalize_url(page_url), page_url)
+        return list(unique_urls.values())[:max_pages]
+    
+    def _api_formats(self, formats: List[str]) -> List[str]:
+        """
+        Get the formats to request, validated when using the local Docker API.
+        
+        Args:
+            formats (List[str]): The requested formats
+            
+        Returns:
+            List[str]: The formats to send to the API
+        """
+        # Validate formats for Docker API if needed
+        if self.use_local_docker:
+            return _validate_formats(formats)
+        return formats
+    
     def deep_research(self, query: str, 
                      max_depth: int = 5,
                      max_urls: int = 10,
@@ -322,59 +934,85 @@ class WebToTextExtractor:
         """
         try:
             logger.info(f"Starting deep research on: {query}")
+            research_response = self.app.deep_research(query, **self._deep_research_params(max_depth, max_urls, time_limit))
+            return self._deep_research_result(research_response)
             
-            # Start deep research
-            research_params = {
-                'maxDepth': max_depth,
-                'maxUrls': max_urls,
-                'timeLimit': time_limit
-            }
-            
-            research_response = self.app.deep_research(query, params=research_params)
-            
-            if not research_response.success:
-                logger.error(f"Deep research failed: {research_response.error}")
-                return {'success': False, 'error': research_response.error}
-                
-            # Get the research ID
-            research_id = research_response.id
-            
-            # Poll for status until complete
-            status = "processing"
-            result = None
+        except Exception as e:
+            logger.error(f"Error in deep_research: {str(e)}")
+            raise
+    
+    async def adeep_research(self, query: str, 
+                             max_depth: int = 5,
+                             max_urls: int = 10,
+                             time_limit: int = 180,
+                             formats: List[str] = ['markdown']) -> Dict[str, Any]:
+        """
+        Async version of deep_research that runs the research without blocking the event loop.
+        
+        FirecrawlApp.deep_research is a single blocking call (a search followed by
+        the page scrapes) that returns the finished result; there is no research
+        job to start and poll. The call therefore runs in a worker thread, which
+        stays busy for the whole research.
+        
+        Args:
+            query (str): The research query
+            max_depth (int): Maximum depth of link following
+            max_urls (int): Maximum number of URLs to process
+            time_limit (int): Time limit in seconds
+            formats (List[str]): List of formats to extract from each page
             
-            while status in ["processing", "scraping"]:
-                status_response = self.app.deep_research_status(research_id)
-                status = status_response.status
-                
-                if status == "done":
-                    # Process the results
-                    sources = status_response.sources
-                    activities = status_response.activities
-                    summaries = status_response.summaries
-                    
-                    result = {
-                        'success': True,
-                        'sources': sources,
-                        'activities': activities,
-                        'summaries': summaries,
-                        'research_id': research_id
-                    }
-                    break
-                    
-                elif status == "error":
-                    logger.error(f"Deep research error: {status_response.error}")
-                    return {'success': False, 'error': status_response.error}
-                    
-                # Wait before polling again
-                import time
-                time.sleep(2)
-                
-            return result or {'success': False, 'error': 'Research timed out'}
+        Returns:
+            Dict[str, Any]: Dictionary containing research results
+        """
+        try:
+            logger.info(f"Starting deep research on: {query}")
+            research_response = await asyncio.to_thread(
+                self.app.deep_research, query, **self._deep_research_params(max_depth, max_urls, time_limit)
+            )
+            return self._deep_research_result(research_response)
             
         except Exception as e:
-            logger.error(f"Error in deep_research: {str(e)}")
+            logger.error(f"Error in adeep_research: {str(e)}")
             raise
+    
+    def _deep_research_params(self, max_depth: int, max_urls: int, time_limit: int) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for FirecrawlApp.deep_research.
+        
+        Args:
+            max_depth (int): Maximum depth of link following
+            max_urls (int): Maximum number of URLs to process
+            time_limit (int): Time limit in seconds
+            
+        Returns:
+            Dict[str, Any]: The deep research arguments
+        """
+        return {
+            'max_depth': max_depth,
+            'max_urls': max_urls,
+            'time_limit': time_limit
+        }
+    
+    def _deep_research_result(self, research_response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn a FirecrawlApp.deep_research response into a research result.
+        
+        Args:
+            research_response (Dict[str, Any]): The deep research response
+            
+        Returns:
+            Dict[str, Any]: The research results ('content' and 'sources'), or the error
+        """
+        if not research_response.get('success', False):
+            error = research_response.get('error', 'Unknown error')
+            logger.error(f"Deep research failed: {error}")
+            return {'success': False, 'error': error}
+        
+        return {
+            'success': True,
+            'content': research_response.get('content', ''),
+            'sources': research_response.get('sources', [])
+        }
             
     def generate_llms_text(self, query: str, 
                           max_urls: int = 10,
@@ -449,62 +1087,60 @@ class WebToTextExtractor:
             logger.error(f"Error extracting structured data: {str(e)}")
             raise
             
-    def combine_results_for_llm(self, results: List[Dict[str, Any]], 
+    def combine_results_for_llm(self, results: Iterable[Dict[str, Any]], 
                               format: str = 'markdown',
                               include_metadata: bool = True) -> str:
         """
         Combine multiple extraction results into a single text suitable for LLMs.
         
         Args:
-            results (List[Dict[str, Any]]): List of extraction results
+            results (Iterable[Dict[str, Any]]): Extraction results, e.g. a list or one of the iter_* generators
             format (str): Format to use ('markdown', 'text')
             include_metadata (bool): Whether to include metadata
             
         Returns:
             str: Combined text suitable for LLMs
         """
-        combined = []
+        buf = io.StringIO()
         
         for i, result in enumerate(results, 1):
+            if i > 1:
+                buf.write("\n")
+            
             # Add separator
-            combined.append(f"\n{'=' * 80}\n")
+            buf.write(_RESULT_SEPARATOR)
             
             # Add source information
             if include_metadata:
-                url = result.get('url', '')
                 metadata = result.get('metadata', {})
-                title = metadata.get('title', f"Source {i}")
-                
-                combined.append(f"# {title}\n")
-                combined.append(f"URL: {url}\n")
-                
-                if 'description' in metadata and metadata['description']:
-                    combined.append(f"Description: {metadata['description']}\n")
-                if 'author' in metadata and metadata['author']:
-                    combined.append(f"Author: {metadata['author']}\n")
-                if 'date' in metadata and metadata['date']:
-                    combined.append(f"Date: {metadata['date']}\n")
-                
-                combined.append("\n")
+                header_fields = {
+                    key: f"{label}: {metadata[key]}\n\n" if metadata.get(key) else ""
+                    for key, label in _HEADER_OPTIONAL_FIELDS
+                }
+                header_fields['title'] = metadata.get('title', f"Source {i}")
+                header_fields['url'] = result.get('url', '')
+                buf.write(_HEADER_TMPL.format_map(header_fields))
             
             # Add content
             if format in result:
-                combined.append(result[format])
+                buf.write(result[format])
+                buf.write("\n")
             elif 'markdown' in result:
-                combined.append(result['markdown'])
+                buf.write(result['markdown'])
+                buf.write("\n")
             elif 'text' in result:
-                combined.append(result['text'])
+                buf.write(result['text'])
+                buf.write("\n")
             else:
                 # Fallback to any available content
                 for key in ['html', 'json']:
                     if key in result:
-                        combined.append(f"Content in {key} format:\n")
-                        combined.append(str(result[key]))
+                        buf.write(f"Content in {key} format:\n\n{result[key]}\n")
                         break
             
-            combined.append("\n")
+            buf.write("\n")
         
-        return "\n".join(combined)
+        return buf.getvalue()
 
     @classmethod
     def create_with_local_docker(cls, api_url: Optional[str] = None) -> 'WebToTextExtractor':